@@ -95,6 +95,14 @@ def universal_real_bind(type_var):
     return TypeBind(type_var, Self.universal_real_type)
 
 
+def logic_any_or_single(array, fn):
+    """
+    Like array.logic_any(fn), but return the equation for the only element
+    directly when there is a single one, so that no disjunction is built.
+    """
+    return If(array.length == 1, fn(array.at(0)), array.logic_any(fn))
+
+
 def ref_used_packages():
     """
     If Self is a library item or a subunit, reference the environments for
@@ -561,7 +569,7 @@ class AdaNode(ASTNode):
         .cast(T.Body)._.as_bare_entity.defining_name
         .referenced_unit_or_null(UnitSpecification),
 
-        public=True, doc="""
+        public=True, memoized=True, doc="""
         If this unit has a spec, fetch and return it. Return the null analysis
         unit otherwise. Note that this returns null for specs, as they don't
         have another spec themselves.
@@ -600,6 +608,7 @@ class AdaNode(ASTNode):
     std = Property(
         Self.standard_unit.root.cast(T.CompilationUnit)
         .body.cast(T.LibraryItem).item.as_bare_entity,
+        memoized=True,
         doc="""
         Retrieves the package corresponding to the Standard unit. Used to
         access standard types.
@@ -607,7 +616,7 @@ class AdaNode(ASTNode):
     )
 
     std_env = Property(
-        Self.std.children_env,
+        Self.std.children_env, memoized=True,
         doc="Get the children env of the Standard package."
     )
 
@@ -623,6 +632,18 @@ class AdaNode(ASTNode):
         memoized=True
     )
 
+    @langkit_property(return_type=T.BasicDecl.entity.array, memoized=True)
+    def operator_subprograms(lookup_env=LexicalEnv, op_sym=Symbol):
+        """
+        Static method. Return the subprograms named ``op_sym`` in
+        ``lookup_env``. Called on the unit root so that operators sharing the
+        same env share the lookup.
+        """
+        return lookup_env.get(op_sym).filtermap(
+            lambda e: e.cast_or_raise(T.BasicDecl),
+            lambda e: e.cast_or_raise(T.BasicDecl).is_subprogram
+        )
+
     bool_type = Property(
         Self.std_entity('Boolean'), public=True, doc="""
         Static method. Return the standard Boolean type.
@@ -671,6 +692,12 @@ class AdaNode(ASTNode):
         In other words, whether Self's unit has a WITH clause on "refd_unit",
         or if its spec, or one of its parent specs has one.
         """
+        # The answer only depends on Self's unit, so share it between all the
+        # nodes of the unit.
+        return Self.unit.root.has_with_visibility_implem(refd_unit)
+
+    @langkit_property(return_type=Bool, memoized=True)
+    def has_with_visibility_implem(refd_unit=AnalysisUnit):
         return Or(
             refd_unit.is_referenced_from(Self.unit),
             Self.parent_unit_env(
@@ -693,11 +720,15 @@ class AdaNode(ASTNode):
             # The node is not an unit root
             Not(other_entity.cast(T.BasicDecl).is_unit_root),
 
+            # The node is the root of Self's own unit, which needs no with
+            # clause.
+            other_entity.node.unit == Self.unit,
+
             # Else, check with visibility
             Self.has_with_visibility(other_entity.node.unit)
         )
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def resolve_generic_actual():
         """
         Helper property to resolve the actuals of generic instantiations.
@@ -725,13 +756,7 @@ class AdaNode(ASTNode):
         """
         return (
             Self.parent.parent.cast_or_raise(T.CompilationUnit)
-            .prelude
-            .filter(lambda p: p.is_a(UsePackageClause))
-            .mapcat(
-                lambda p: p.cast_or_raise(UsePackageClause).packages.map(
-                    lambda n: n.cast(AdaNode)
-                )
-            )
+            .use_package_clause_names
         )
 
     @langkit_property()
@@ -854,12 +879,21 @@ class AdaNode(ASTNode):
         matching formal in Self, and whether this formal is optional (i.e. has
         a default value).
         """
+        return Self.match_unpacked_formals(
+            Self.unpack_formals(formal_params), params, is_dottable_subp
+        )
+
+    @langkit_property(return_type=T.ParamMatch.array)
+    def match_unpacked_formals(unpacked_formals=T.SingleFormal.array,
+                               params=T.AssocList,
+                               is_dottable_subp=Bool):
+        """
+        Like match_formals, but for formals that are already unpacked.
+        """
         def matches(formal, actual):
             return ParamMatch.new(has_matched=True,
                                   formal=formal, actual=actual)
 
-        unpacked_formals = Var(Self.unpack_formals(formal_params))
-
         return params.then(lambda p: p.unpacked_params.map(lambda i, a: If(
             a.name.is_null,
 
@@ -868,14 +902,16 @@ class AdaNode(ASTNode):
                 # name association, make sure we have enough formals.
                 unpacked_formals.at(idx).then(lambda sp: matches(sp, a))),
 
-            # Named parameter case: make sure the designator is
-            # actualy a name and that there is a corresponding
-            # formal.
-            a.name.then(lambda id: (
-                unpacked_formals.find(lambda p: p.name.matches(id)).then(
-                    lambda sp: matches(sp, a)
-                )
-            ))
+            # Named parameter case: make sure that there is a corresponding
+            # formal. Designators are identifiers or, for operator formals,
+            # string literals: compare their symbols directly rather than
+            # going through Name.matches for each formal.
+            Let(
+                lambda sym=a.name.sym:
+                unpacked_formals.find(
+                    lambda p: p.name.name.cast(BaseId)._.sym == sym
+                ).then(lambda sp: matches(sp, a))
+            )
         )))
 
     @langkit_property(public=True, dynamic_vars=[default_imprecise_fallback()])
@@ -1243,6 +1279,7 @@ class BasicDecl(AdaNode):
 
     defining_name = Property(
         Entity.defining_names.at(0), public=True, ignore_warn_on_node=True,
+        memoized=True, memoize_in_populate=True,
         doc="""
         Get the name of this declaration. If this declaration has several
         names, it will return the first one.
@@ -1448,7 +1485,8 @@ class BasicDecl(AdaNode):
         ).cast(T.DeclarativePart),
         doc="Return the scope of definition of this basic declaration.",
         ignore_warn_on_node=True,
-        public=True
+        public=True,
+        memoized=True
     )
 
     relative_name = Property(
@@ -1526,7 +1564,7 @@ class BasicDecl(AdaNode):
                 # Don't try to go to private part if we're not in a package
                 # decl.
 
-                public_scope.get('__privatepart', lookup=LK.flat).at(0).then(
+                public_scope.get_first('__privatepart', lookup=LK.flat).then(
                     lambda pp: pp.children_env, default_val=public_scope
                 ),
                 public_scope
@@ -1654,7 +1692,7 @@ class Body(BasicDecl):
             lambda _: No(T.BasicDecl.entity),
         ))
 
-    @langkit_property(public=True)
+    @langkit_property(public=True, memoized=True)
     def decl_part():
         """
         Return the decl corresponding to this node if applicable.
@@ -1670,7 +1708,7 @@ class Body(BasicDecl):
     def is_subunit():
         return Not(Self.parent.cast(T.Subunit).is_null)
 
-    @langkit_property(ignore_warn_on_node=True, public=True)
+    @langkit_property(ignore_warn_on_node=True, public=True, memoized=True)
     def subunit_root():
         """
         If self is a subunit, return the body in which it is rooted.
@@ -1679,7 +1717,7 @@ class Body(BasicDecl):
             su.name.referenced_unit_or_null(UnitBody)
         ))
 
-    @langkit_property(dynamic_vars=[env])
+    @langkit_property(dynamic_vars=[env], memoized=True)
     def body_scope(follow_private=Bool, force_decl=(Bool, False)):
         """
         Return the scope for this body.
@@ -1688,13 +1726,42 @@ class Body(BasicDecl):
         If force_decl, then returns the corresponding declaration's scope,
         rather than the parent body's scope.
         """
+        public_scope = Var(Entity.body_public_scope(force_decl))
+
+        # If the package has a private part, then get the private part,
+        # else return the public part. For packages, the private part node
+        # tells whether there is one, so don't look it up when it is absent.
+        return If(
+            And(
+                follow_private,
+                public_scope.env_node._.match(
+                    lambda pkg=T.BasePackageDecl:
+                    Not(pkg.private_part.is_null),
+                    lambda _=T.SingleProtectedDecl: True,
+                    lambda _=T.ProtectedTypeDecl: True,
+                    lambda _: False
+                )
+            ),
+            public_scope.get_first('__privatepart', lookup=LK.flat).then(
+                lambda pp: pp.children_env, default_val=public_scope
+            ),
+            public_scope
+        )
+
+    @langkit_property(dynamic_vars=[env], memoized=True)
+    def body_public_scope(force_decl=Bool):
+        """
+        Helper for body_scope: return the public scope for this body, which
+        does not depend on whether the private part is followed.
+        """
+        subunit_root = Var(Self.subunit_root)
 
         scope = Var(Cond(
             # Subunits always appear at the top-level in package bodies. So if
             # this is a subunit, the scope is the same as the scope of the
             # corresponding "is separate" decl, hence: the defining env of this
             # top-level package body.
-            Not(Self.subunit_root.is_null), Self.subunit_root.children_env,
+            Not(subunit_root.is_null), subunit_root.children_env,
 
             # In case this is a library level subprogram that has no spec
             # (which is legal), we'll register this body in the parent
@@ -1718,25 +1785,9 @@ class Body(BasicDecl):
 
         # If this the corresponding decl is a generic, go grab the internal
         # package decl.
-        public_scope = Var(scope.env_node.cast(T.GenericPackageDecl).then(
+        return scope.env_node.cast(T.GenericPackageDecl).then(
             lambda gen_pkg_decl: gen_pkg_decl.package_decl.children_env,
             default_val=scope
-        ))
-
-        # If the package has a private part, then get the private part,
-        # else return the public part.
-        return If(
-            And(
-                follow_private,
-                public_scope.env_node._.is_a(
-                    T.BasePackageDecl, T.SingleProtectedDecl,
-                    T.ProtectedTypeDecl,
-                )
-            ),
-            public_scope.get('__privatepart', lookup=LK.flat).at(0).then(
-                lambda pp: pp.children_env, default_val=public_scope
-            ),
-            public_scope
         )
 
 
@@ -1764,7 +1815,7 @@ class BaseFormalParamDecl(BasicDecl):
 
     formal_type = Property(
         bind_origin(Self, Entity.type_expression._.designated_type),
-        doc="Return the type for this formal.", public=True
+        doc="Return the type for this formal.", public=True, memoized=True
     )
 
     @langkit_property()
@@ -1849,6 +1900,7 @@ class BaseFormalParamHolder(AdaNode):
 
     unpacked_formal_params = Property(
         Self.unpack_formals(Entity.abstract_formal_params),
+        memoized=True,
         doc="""
         Couples (identifier, param spec) for all parameters
         """
@@ -1857,15 +1909,15 @@ class BaseFormalParamHolder(AdaNode):
     @langkit_property(return_type=T.ParamMatch.array, dynamic_vars=[env])
     def match_param_list(params=T.AssocList,
                          is_dottable_subp=Bool):
-        return Self.match_formals(
-            Entity.abstract_formal_params, params, is_dottable_subp
+        return Self.match_unpacked_formals(
+            Entity.unpacked_formal_params, params, is_dottable_subp
         )
 
     nb_min_params = Property(
         Self.as_bare_entity.unpacked_formal_params.filter(
             lambda p: p.spec.is_mandatory
         ).length,
-        type=Int, public=True, doc="""
+        type=Int, public=True, memoized=True, doc="""
         Return the minimum number of parameters this subprogram can be called
         while still being a legal call.
         """
@@ -1873,7 +1925,7 @@ class BaseFormalParamHolder(AdaNode):
 
     nb_max_params = Property(
         Self.as_bare_entity.unpacked_formal_params.length, public=True,
-        type=Int, doc="""
+        type=Int, memoized=True, doc="""
         Return the maximum number of parameters this subprogram can be called
         while still being a legal call.
         """
@@ -1902,14 +1954,11 @@ class BaseFormalParamHolder(AdaNode):
         other_params = Var(other.unpacked_formal_params)
         return And(
             self_params.length == other_params.length,
-            self_params.all(lambda i, p: And(
-                p.name.matches(other_params.at(i).name) | Not(match_names),
-                bind_origin(
-                    Self,
-                    p.spec.formal_type
-                    ._.matching_type(other_params.at(i).spec.formal_type)
-                )
-            ))
+            bind_origin(Self, self_params.all(lambda i, p: And(
+                Not(match_names) | p.name.matches(other_params.at(i).name),
+                p.spec.formal_type
+                ._.matching_type(other_params.at(i).spec.formal_type)
+            )))
         )
 
     @langkit_property(return_type=Bool, dynamic_vars=[env])
@@ -1919,18 +1968,23 @@ class BaseFormalParamHolder(AdaNode):
         whether the argument count (and designators, if any) match.
         """
         bare = Var(Self.as_bare_entity)
-        match_list = Var(bare.match_param_list(params, is_dottable_subp))
         nb_max_params = If(is_dottable_subp, bare.nb_max_params - 1,
                            bare.nb_max_params)
         nb_min_params = If(is_dottable_subp, bare.nb_min_params - 1,
                            bare.nb_min_params)
 
+        # Check the arity first, so that params are only matched against
+        # formals for candidates that can accept them.
         return And(
             params.length <= nb_max_params,
-            match_list.all(lambda m: m.has_matched),
-            match_list.filter(
-                lambda m: m.formal.spec.is_mandatory
-            ).length == nb_min_params,
+            Let(lambda match_list=bare.match_param_list(
+                params, is_dottable_subp
+            ): And(
+                match_list.all(lambda m: m.has_matched),
+                match_list.filter(
+                    lambda m: m.formal.spec.is_mandatory
+                ).length == nb_min_params,
+            ))
         )
 
     @langkit_property(return_type=T.BaseTypeDecl.entity,
@@ -2219,7 +2273,7 @@ class ComponentDecl(BaseFormalParamDecl):
                     Entity.container_type,
                     eq_prop=BaseTypeDecl.matching_prefix_type)
 
-    @langkit_property(return_type=T.BaseTypeDecl.entity)
+    @langkit_property(return_type=T.BaseTypeDecl.entity, memoized=True)
     def container_type():
         """
         Return the defining container type for this component declaration.
@@ -2290,7 +2344,7 @@ class ComponentList(BaseFormalParamHolder):
             ret
         )
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def abstract_formal_params():
         return Entity.abstract_formal_params_impl(No(T.ParamMatch.array))
 
@@ -2600,7 +2654,8 @@ class BaseTypeDecl(BasicDecl):
     def accessed_type():
         return No(T.BaseTypeDecl.entity)
 
-    @langkit_property(dynamic_vars=[origin], return_type=T.BaseTypeDecl.entity)
+    @langkit_property(dynamic_vars=[origin], return_type=T.BaseTypeDecl.entity,
+                      memoized=True)
     def final_accessed_type(first_call=(Bool, True)):
         """
         Call accessed_type recursively until we get the most nested accessed
@@ -2644,7 +2699,8 @@ class BaseTypeDecl(BasicDecl):
 
     base_types = Property(
         Entity.base_type.then(lambda bt: bt.singleton)
-        .concat(Entity.base_interfaces)
+        .concat(Entity.base_interfaces),
+        memoized=True
     )
 
     base_interfaces = Property(No(T.BaseTypeDecl.entity.array))
@@ -2712,13 +2768,27 @@ class BaseTypeDecl(BasicDecl):
         """
         Whether Self is derived from other_type.
         """
-        entity_can = Var(Entity.canonical_type)
         other_can = Var(other_type.canonical_type)
+        return Entity.is_derived_type_impl(other_can,
+                                           other_can._.classwide_type)
+
+    @langkit_property(return_type=Bool, dynamic_vars=[origin])
+    def is_derived_type_impl(other_can=T.BaseTypeDecl.entity,
+                             other_cw=T.ClasswideTypeDecl.entity):
+        """
+        Implementation helper for is_derived_type. ``other_can`` and
+        ``other_cw`` are the canonical type and classwide type of the type we
+        are looking for: computing them once in is_derived_type avoids
+        recomputing them at each step of the walk up the derivation chain.
+        """
+        entity_can = Var(Entity.canonical_type)
         return Or(
             entity_can == other_can,
             And(Not(Entity.classwide_type.is_null),
-                entity_can.classwide_type == other_can.classwide_type),
-            Entity.base_types.any(lambda bt: bt._.is_derived_type(other_type))
+                entity_can.classwide_type == other_cw),
+            Entity.base_types.any(
+                lambda bt: bt._.is_derived_type_impl(other_can, other_cw)
+            )
         )
 
     is_iterable_type = Property(
@@ -2788,10 +2858,10 @@ class BaseTypeDecl(BasicDecl):
                                   accept_derived=(Bool, False)):
         actual_type = Var(Entity)
         return Or(
-            And(formal_type.is_classwide | accept_derived,
-                actual_type.is_derived_type(formal_type)),
-
-            And(actual_type.is_classwide,
+            # Check the cheap classwide/accept_derived conditions first, so
+            # that the derivation chain is walked at most once.
+            And(formal_type.is_classwide | accept_derived
+                | actual_type.is_classwide,
                 actual_type.is_derived_type(formal_type)),
 
             # Matching of access types parameters
@@ -2863,7 +2933,8 @@ class BaseTypeDecl(BasicDecl):
         )
 
     @langkit_property(return_type=T.BaseTypeDecl.entity,
-                      dynamic_vars=[(origin, No(T.AdaNode))], public=True)
+                      dynamic_vars=[(origin, No(T.AdaNode))], public=True,
+                      memoized=True)
     def canonical_type():
         """
         Return the canonical type declaration for this type declaration. For
@@ -3031,7 +3102,8 @@ class TypeDecl(BaseTypeDecl):
         doc="""
         Whether Self is a type that is iterable in a for .. of loop
         """,
-        dynamic_vars=[origin]
+        dynamic_vars=[origin],
+        memoized=True
     )
 
     @langkit_property()
@@ -3084,17 +3156,17 @@ class TypeDecl(BaseTypeDecl):
     def primitives():
         pass
 
-    array_ndims = Property(Entity.type_def.array_ndims)
+    array_ndims = Property(Entity.type_def.array_ndims, memoized=True)
 
     is_record_type = Property(Entity.type_def.is_record_type)
     is_real_type = Property(Entity.type_def.is_real_type)
     is_float_type = Property(Entity.type_def.is_real_type)
     is_fixed_point = Property(Entity.type_def.is_real_type)
-    is_int_type = Property(Entity.type_def.is_int_type)
+    is_int_type = Property(Entity.type_def.is_int_type, memoized=True)
     is_access_type = Property(Self.as_bare_entity.type_def.is_access_type)
     is_static_decl = Property(Self.as_bare_entity.type_def.is_static)
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def accessed_type():
         imp_deref = Var(Entity.get_imp_deref)
 
@@ -3123,7 +3195,7 @@ class TypeDecl(BaseTypeDecl):
     is_tagged_type = Property(Entity.type_def.is_tagged_type)
     base_type = Property(Entity.type_def.base_type)
     base_interfaces = Property(Entity.type_def.base_interfaces)
-    is_char_type = Property(Entity.type_def.is_char_type)
+    is_char_type = Property(Entity.type_def.is_char_type, memoized=True)
     is_enum_type = Property(Entity.type_def.is_enum_type)
     is_private = Property(
         Self.type_def.is_a(T.PrivateTypeDef)
@@ -3143,7 +3215,7 @@ class TypeDecl(BaseTypeDecl):
         lambda _: Entity
     ))
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def defining_env():
         imp_deref = Var(Entity.get_imp_deref)
 
@@ -3343,9 +3415,10 @@ class SynthAnonymousTypeDecl(AnonymousTypeDecl):
 class EnumTypeDef(TypeDef):
     enum_literals = Field(type=T.EnumLiteralDecl.list)
 
-    is_char_type = Property(Self.enum_literals.any(
-        lambda lit: lit.name.name.is_a(T.CharLiteral)
-    ))
+    is_char_type = Property(
+        Self.enum_literals.any(lambda lit: lit.name.name.is_a(T.CharLiteral)),
+        memoized=True, memoize_in_populate=True
+    )
 
     is_enum_type = Property(True)
 
@@ -3508,7 +3581,8 @@ class DerivedTypeDef(TypeDef):
 
     # TODO: this origin bind is erroneous
     base_type = Property(
-        bind_origin(Self, Entity.subtype_indication.designated_type)
+        bind_origin(Self, Entity.subtype_indication.designated_type),
+        memoized=True
     )
 
     base_interfaces = Property(
@@ -3626,7 +3700,7 @@ class UnconstrainedArrayIndices(ArrayIndices):
     def constrain_index_expr(index_expr=T.Expr, dim=Int):
         return TypeBind(index_expr.type_var, Entity.index_type(dim))
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def index_type(dim=Int):
         return Entity.types.at(dim).designated_type
 
@@ -3653,7 +3727,7 @@ class ConstrainedArrayIndices(ArrayIndices):
             )
         )
 
-    @langkit_property(dynamic_vars=[origin])
+    @langkit_property(dynamic_vars=[origin], memoized=True)
     def index_type(dim=Int):
         # We might need to solve self's equation to get the index type
         ignore(Var(Self.parents.find(
@@ -3739,7 +3813,7 @@ class BaseSubtypeDecl(BaseTypeDecl):
     array_ndims = Property(Entity.from_type.array_ndims)
     defining_env = Property(Entity.from_type.defining_env)
 
-    canonical_type = Property(Entity.from_type.canonical_type)
+    canonical_type = Property(Entity.from_type.canonical_type, memoized=True)
     record_def = Property(Entity.from_type.record_def)
     accessed_type = Property(Entity.from_type.accessed_type)
     is_int_type = Property(Entity.from_type.is_int_type)
@@ -3766,7 +3840,8 @@ class SubtypeDecl(BaseSubtypeDecl):
     subtype = Field(type=T.SubtypeIndication)
     aspects = Field(type=T.AspectSpec)
 
-    @langkit_property(return_type=T.BaseTypeDecl.entity, dynamic_vars=[origin])
+    @langkit_property(return_type=T.BaseTypeDecl.entity, dynamic_vars=[origin],
+                      memoized=True)
     def from_type():
         return Entity.subtype.designated_type.match(
             lambda st=T.SubtypeDecl: st.from_type,
@@ -4066,6 +4141,12 @@ class AnonymousType(TypeExpr):
     type_decl = Field(type=T.AnonymousTypeDecl)
 
     designated_type = Property(Entity.type_decl)
+
+    # The designated type is always the type_decl child, so go straight to it
+    # rather than through the null-safe designated_type calls of TypeExpr.
+    accessed_type = Property(Entity.type_decl.accessed_type)
+    defining_env = Property(Entity.type_decl.defining_env)
+
     xref_equation = Property(Entity.type_decl.sub_equation)
 
 
@@ -4079,9 +4160,14 @@ class SubtypeIndication(TypeExpr):
     # environment the caller is using. However we need to inherit the
     # visibility (origin node) of the caller.
     designated_type = Property(
-        env.bind(Entity.node_env, Entity.name.designated_type_impl)
+        env.bind(Entity.node_env, Entity.name.designated_type_impl),
+        memoized=True
     )
 
+    # Names cannot designate anonymous types, so there is no anonymous access
+    # to look through here.
+    element_type = Property(Entity.designated_type)
+
     @langkit_property()
     def xref_equation():
         # Called by allocator.xref_equation, since the suffix can be either a
@@ -4253,7 +4339,7 @@ class BasicSubpDecl(BasicDecl):
             LogicTrue()
         )
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def expr_type():
 
         return Entity.type_expression.then(lambda te: te.designated_type)
@@ -5137,7 +5223,9 @@ class AbstractFormalSubpDecl(FormalSubpDecl):
 class GenericFormalPart(BaseFormalParamHolder):
     decls = Field(type=T.AdaNode.list)
 
-    abstract_formal_params = Property(Entity.decls.keep(BaseFormalParamDecl))
+    abstract_formal_params = Property(
+        Entity.decls.keep(BaseFormalParamDecl), memoized=True
+    )
 
 
 @abstract
@@ -5370,9 +5458,12 @@ class Expr(AdaNode):
         """
         pass
 
+    # Every env_elements_impl ends up in BaseId.env_elements_baseid, which
+    # already filters out elements that are not visible.
     env_elements = Property(
-        Entity.env_elements_impl.filter(lambda e: Self.has_visibility(e)),
-        dynamic_vars=[env]
+        Entity.env_elements_impl,
+        dynamic_vars=[env],
+        memoized=True
     )
 
     @langkit_property(return_type=AdaNode.entity.array,
@@ -5429,7 +5520,7 @@ class Op(EnumNode):
                     "lte", "gt", "gte", "double_dot"]
 
     subprograms = Property(
-        lambda: Self.node_env.get(Self.match(
+        lambda: Self.unit.root.operator_subprograms(Self.node_env, Self.match(
             lambda _=Op.alt_and: '"and"',
             lambda _=Op.alt_or: '"or"',
             lambda _=Op.alt_xor: '"xor"',
@@ -5450,10 +5541,7 @@ class Op(EnumNode):
             lambda _=Op.alt_gt: '">"',
             lambda _=Op.alt_gte: '">="',
             lambda _: '<<>>',
-        )).filtermap(
-            lambda e: e.cast_or_raise(T.BasicDecl),
-            lambda e: e.cast_or_raise(T.BasicDecl).is_subprogram
-        ),
+        )),
         doc="""
         Return the subprograms corresponding to this operator accessible in the
         lexical environment.
@@ -5517,8 +5605,15 @@ class BinOp(Expr):
         return (
             Entity.left.sub_equation
             & Entity.right.sub_equation
-        ) & (subps.logic_any(lambda subp: Let(
-            lambda ps=subp.subp_spec_or_null.unpacked_formal_params:
+        ) & If(
+            # Don't build an empty disjunction when there is no candidate
+            # operator subprogram.
+            subps.length == 0,
+            Self.no_overload_equation,
+
+            logic_any_or_single(subps, lambda subp: Let(
+            lambda spec=subp.subp_spec_or_null: Let(
+            lambda ps=spec.unpacked_formal_params:
 
             # The subprogram's first argument must match Self's left
             # operand.
@@ -5529,12 +5624,12 @@ class BinOp(Expr):
             & TypeBind(Self.right.type_var, ps.at(1).spec.formal_type)
 
             # The subprogram's return type is the type of Self
-            & TypeBind(Self.type_var,
-                       subp.subp_spec_or_null.return_type)
+            & TypeBind(Self.type_var, spec.return_type)
 
             # The operator references the subprogram
             & Bind(Self.op.ref_var, subp)
-        )) | Self.no_overload_equation)
+        ))) | Self.no_overload_equation
+        )
 
     @langkit_property(dynamic_vars=[origin])
     def no_overload_equation():
@@ -5655,7 +5750,8 @@ class Aggregate(BaseAggregate):
         Self, Predicate(BaseTypeDecl.is_array_or_rec, Self.type_var)
     ))
 
-    @langkit_property(return_type=T.BaseAggregate, ignore_warn_on_node=True)
+    @langkit_property(return_type=T.BaseAggregate, ignore_warn_on_node=True,
+                      memoized=True)
     def root_direct_parent_aggregate():
         return Self.direct_parent_aggregate.then(
             lambda p: p.root_direct_parent_aggregate,
@@ -5949,9 +6045,14 @@ class Name(Expr):
                   Self)
 
     @langkit_property(return_type=Equation, dynamic_vars=[env, origin])
-    def parent_name_equation(typ=T.BaseTypeDecl.entity, root=T.Name):
+    def parent_name_equation(typ=T.BaseTypeDecl.entity, root=T.Name,
+                             constrain_params=(Bool, True)):
         """
         Construct the xref equation for the chain of parent nested names.
+
+        If ``constrain_params`` is False, the sub equations for Self's own
+        actual parameters are not included, because the caller already
+        built them.
         """
         return If(
             typ.is_null,
@@ -5959,7 +6060,9 @@ class Name(Expr):
 
             Self.match(
                 lambda ce=T.CallExpr:
-                ce.as_entity.subscriptable_type_equation(typ),
+                ce.as_entity.subscriptable_type_equation(
+                    typ, constrain_params
+                ),
 
                 lambda ed=T.ExplicitDeref: ed.as_entity.eq_for_type(typ),
 
@@ -6111,11 +6214,11 @@ class Name(Expr):
         return Self.match(
             lambda id=Identifier:
                 n.cast(Identifier).then(
-                    lambda other_id: id.sym.equals(other_id.sym)
+                    lambda other_id: id.sym == other_id.sym
                 ),
             lambda sl=StringLiteral:
                 n.cast(StringLiteral).then(
-                    lambda other_sl: sl.sym.equals(other_sl.sym)
+                    lambda other_sl: sl.sym == other_sl.sym
                 ),
             lambda di=DefiningName: n.matches(di.name),
             lambda _: False
@@ -6239,6 +6342,19 @@ class Name(Expr):
             Not(Self.parent.is_a(T.DottedName))
         )
 
+    @langkit_property(return_type=T.CallExpr, ignore_warn_on_node=True)
+    def name_callexpr():
+        """
+        If Self is the name of a CallExpr, possibly through the suffix of
+        enclosing DottedNames, return this CallExpr. Return null otherwise.
+        """
+        return Self.parent._.match(
+            lambda ce=T.CallExpr: If(ce.name == Self, ce, No(T.CallExpr)),
+            lambda dn=T.DottedName: If(dn.suffix == Self, dn.name_callexpr,
+                                       No(T.CallExpr)),
+            lambda _: No(T.CallExpr)
+        )
+
     is_operator_name = Property(
         Entity.name_symbol.any_of(
             '"="',  '"="', '"/="', '"<"', '"<="', '">"', '">="', '"and"',
@@ -6337,7 +6453,8 @@ class CallExpr(Name):
         )
 
     @langkit_property(return_type=Equation, dynamic_vars=[env, origin])
-    def entity_equation(s=T.BasicDecl.entity, root=T.Name):
+    def entity_equation(s=T.BasicDecl.entity, root=T.Name,
+                        constrain_params=(Bool, True)):
         # The called entity is the matched entity
         return Bind(Self.name.ref_var, s) & Cond(
 
@@ -6345,14 +6462,14 @@ class CallExpr(Name):
             # chain of name equations starting from self, with the parent
             # component.
             s.is_paramless, Entity.parent_name_equation(
-                s.expr_type, root
+                s.expr_type, root, constrain_params
             ),
 
             # If S can be called in a paramless fashion, but can also be
             # called with parameters, we are forced to make a disjunction.
             s.can_be_paramless, Or(
                 Entity.parent_name_equation(
-                    s.expr_type, root
+                    s.expr_type, root, constrain_params
                 ),
 
                 And(
@@ -6393,16 +6510,18 @@ class CallExpr(Name):
         subps = Var(Entity.env_elements)
 
         return And(
+            # The actuals' sub equations are built once here, so that they
+            # are not duplicated for every candidate below.
             Self.params.logic_all(lambda pa: pa.expr.as_entity.sub_equation),
 
             # For each potential entity match, we want to express the
             # following constraints:
             And(
-                subps.logic_any(lambda e: Let(
+                logic_any_or_single(subps, lambda e: Let(
                     lambda s=e.cast_or_raise(BasicDecl.entity):
                     If(
                         s.cast(EntryDecl)._.spec.family_type.is_null,
-                        Entity.entity_equation(s, root),
+                        Entity.entity_equation(s, root, False),
                         Self.parent_name(root).cast_or_raise(T.CallExpr)
                         .as_entity.entity_equation(s, root),
                     ),
@@ -6660,7 +6779,7 @@ class ParamActual(Struct):
 
 class AssocList(BasicAssoc.list):
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def unpacked_params():
         """
         Given the list of ParamAssoc, that can in certain case designate
@@ -6840,11 +6959,14 @@ class CaseExpr(Expr):
             True, Predicate(BaseTypeDecl.is_discrete_type, Self.expr.type_var)
         )))
 
+        # Read the type of the resolved expression once for all choices
+        case_type = Var(Self.expr.type_val)
+
         return Entity.cases.logic_all(lambda alt: (
             alt.choices.logic_all(lambda c: c.match(
                 # Expression case
                 lambda e=T.Expr:
-                TypeBind(e.type_var, Self.expr.type_val)
+                TypeBind(e.type_var, case_type)
                 & e.sub_equation,
 
                 # TODO: Bind other cases: SubtypeIndication and Range
@@ -7030,7 +7152,7 @@ class BaseId(SingleTokNode):
             default_val=ret
         )
 
-    designated_env = Property(Entity.designated_env_impl)
+    designated_env = Property(Entity.designated_env_impl, memoized=True)
 
     @langkit_property()
     def designated_env_no_overloading():
@@ -7056,24 +7178,24 @@ class BaseId(SingleTokNode):
             lambda p: p.is_a(GenericPackageInstantiation)
         ))
 
-        env_els = Var(Entity.env_elements_baseid.then(
-            lambda all_env_els:
-            all_env_els.filter(lambda e: And(
-                # Exclude own generic package instantiation from the lookup
-                Not(e.node == bd),
+        # env_elements_baseid already filters out elements that are not
+        # visible from Self.
+        def is_candidate(e):
+            # Exclude own generic package instantiation from the lookup
+            return Not(e.node == bd)
 
-                Self.has_visibility(e)
-            ),
-            )
-        ))
+        env_els = Var(Entity.env_elements_baseid)
 
-        pkg = Var(env_els.at(0).cast(T.BasicDecl))
+        # Only the first candidate matters when it is a package, so find it
+        # without building the filtered array.
+        pkg = Var(env_els.find(is_candidate).cast(T.BasicDecl))
 
         return bind_origin(Self, If(
             pkg._.is_package,
             Entity.pkg_env(pkg),
-            env_els.map(
-                lambda e: e.cast(BasicDecl).defining_env
+            env_els.filtermap(
+                lambda e: e.cast(BasicDecl).defining_env,
+                is_candidate
             ).env_group()
         ))
 
@@ -7110,7 +7232,7 @@ class BaseId(SingleTokNode):
         # If the basic_decl is a package decl with a private part, we get it.
         # Else we keep the defining env.
         env_private_part = Var(
-            env.get('__privatepart', LK.flat, categories=noprims).at(0).then(
+            env.get_first('__privatepart', LK.flat, categories=noprims).then(
                 lambda pp: pp.children_env, default_val=env
             )
         )
@@ -7200,7 +7322,8 @@ class BaseId(SingleTokNode):
             des_type
         )
 
-    @langkit_property(return_type=CallExpr, ignore_warn_on_node=True)
+    @langkit_property(return_type=CallExpr, ignore_warn_on_node=True,
+                      memoized=True)
     def parent_callexpr():
         """
         If this BaseId is the main symbol qualifying the prefix in a call
@@ -7219,14 +7342,7 @@ class BaseId(SingleTokNode):
             C (12, 15);
                ^ parent_callexpr = null
         """
-        return Self.parents.take_while(lambda p: Or(
-            p.is_a(CallExpr),
-            p.is_a(DottedName, BaseId) & p.parent.match(
-                lambda pfx=DottedName: pfx.suffix == p,
-                lambda ce=CallExpr: ce.name == p,
-                lambda _: False
-            )
-        )).find(lambda p: p.is_a(CallExpr)).cast(CallExpr)
+        return Self.name_callexpr
 
     @langkit_property(dynamic_vars=[env])
     def env_elements_impl():
@@ -7257,6 +7373,11 @@ class BaseId(SingleTokNode):
             # TODO: The fact that this is here is ugly, and also the logic is
             # probably wrong.
             from_node=If(Self.in_aspect, No(T.AdaNode), Self)
+        ).filter(
+            # Apply the visibility filter of Expr.env_elements right away, so
+            # that the more expensive filters below only run on visible
+            # elements.
+            lambda e: Self.has_visibility(e)
         ))
 
         # TODO: there is a big smell here: We're doing the filtering for parent
@@ -7389,9 +7510,9 @@ class EnumLiteralDecl(BasicDecl):
         """
         Return the enum type corresponding to this enum literal.
         """
-        return Self.parents.find(
-            lambda p: p.is_a(TypeDecl)
-        ).cast(TypeDecl).as_entity
+        # Self is in the literal list of an EnumTypeDef, which is the type_def
+        # of its TypeDecl.
+        return Self.parent.parent.parent.cast(TypeDecl).as_entity
 
     @langkit_property()
     def expr_type():
@@ -7518,7 +7639,8 @@ class BaseSubpSpec(BaseFormalParamHolder):
     )
 
     abstract_formal_params = Property(
-        Entity.params.map(lambda p: p.cast(BaseFormalParamDecl))
+        Entity.params.map(lambda p: p.cast(BaseFormalParamDecl)),
+        memoized=True
     )
 
     @langkit_property(return_type=Bool)
@@ -7577,7 +7699,8 @@ class BaseSubpSpec(BaseFormalParamHolder):
         """
         return Entity.params._.at(0)._.type_expr._.element_type
 
-    @langkit_property(return_type=BaseTypeDecl.entity, public=True)
+    @langkit_property(return_type=BaseTypeDecl.entity, public=True,
+                      memoized=True)
     def primitive_subp_of():
         """
         Return the type of which this subprogram is a primitive of.
@@ -7598,15 +7721,20 @@ class BaseSubpSpec(BaseFormalParamHolder):
             )
         ))
 
+        # The scopes a primitive's type must be declared in do not depend on
+        # the type, so compute them once.
+        bd_scope = Var(bd.declarative_scope)
+        bd_public_part = Var(
+            bd_scope._.parent.cast(BasePackageDecl)._.public_part
+        )
+
         return types.find(lambda typ: typ.then(
             lambda typ: typ.declarative_scope.then(lambda ds: ds.any_of(
-                bd.declarative_scope,
-                bd.declarative_scope._.parent.cast(BasePackageDecl)
-                ._.public_part
+                bd_scope, bd_public_part
             ))
         ))
 
-    @langkit_property(return_type=BaseTypeDecl.entity)
+    @langkit_property(return_type=BaseTypeDecl.entity, memoized=True)
     def dottable_subp_of():
         """
         Returns wether the subprogram containing this spec is a subprogram
@@ -7663,7 +7791,8 @@ class SubpSpec(BaseSubpSpec):
     subp_returns = Field(type=T.TypeExpr)
 
     name = Property(Self.subp_name)
-    params = Property(Entity.subp_params._.params.map(lambda p: p))
+    params = Property(Entity.subp_params._.params.map(lambda p: p),
+                      memoized=True)
 
     returns = Property(Entity.subp_returns)
 
@@ -7691,7 +7820,8 @@ class EntrySpec(BaseSubpSpec):
         Entity.entry_params.then(
             lambda p: p.params.map(lambda p: p),
             default_val=No(T.ParamSpec.entity.array)
-        )
+        ),
+        memoized=True
     )
     returns = Property(No(T.TypeExpr.entity))
 
@@ -7895,7 +8025,7 @@ class QualExpr(Name):
 
     @langkit_property(return_type=Equation)
     def xref_equation():
-        typ = Entity.prefix.designated_type_impl
+        typ = Var(Entity.prefix.designated_type_impl)
 
         return (
             Entity.suffix.sub_equation
@@ -8402,7 +8532,7 @@ class DottedName(Name):
         return env.bind(pfx_env,
                         Entity.suffix.designated_env_no_overloading)
 
-    @langkit_property()
+    @langkit_property(memoized=True)
     def designated_env():
         pfx_env = Var(Entity.prefix.designated_env)
         return env.bind(pfx_env,
@@ -8470,6 +8600,20 @@ class CompilationUnit(AdaNode):
         """
         pass
 
+    @langkit_property(memoized=True, memoize_in_populate=True)
+    def use_package_clause_names():
+        """
+        Return a flat list of all names for UsePackageClause nodes in this
+        compilation unit's prelude.
+        """
+        return Self.prelude.filter(
+            lambda p: p.is_a(UsePackageClause)
+        ).mapcat(
+            lambda p: p.cast_or_raise(UsePackageClause).packages.map(
+                lambda n: n.cast(AdaNode)
+            )
+        )
+
     @langkit_property(public=True)
     def syntactic_fully_qualified_name():
         """
@@ -8790,6 +8934,7 @@ class ReturnStmt(SimpleStmt):
 
     subp = Property(
         Self.parents.find(lambda p: p.is_a(SubpBody)).cast(SubpBody).as_entity,
+        memoized=True,
         doc="Returns the subprogram this return statement belongs to"
     )
 
@@ -8999,11 +9144,14 @@ class CaseStmt(CompositeStmt):
                             Self.expr.type_var)
         )))
 
+        # Read the type of the resolved expression once for all choices
+        case_type = Var(Self.expr.type_val)
+
         return Entity.alternatives.logic_all(lambda alt: (
             alt.choices.logic_all(lambda c: c.match(
                 # Expression case
                 lambda e=T.Expr:
-                TypeBind(e.type_var, Self.expr.type_val) & e.sub_equation,
+                TypeBind(e.type_var, case_type) & e.sub_equation,
 
                 # TODO: Bind other cases: SubtypeIndication and Range
                 lambda _: LogicTrue()
@@ -9131,9 +9279,9 @@ class PackageBody(Body):
 
     @langkit_property()
     def subunit_pkg_stub_env():
-        return Entity.subunit_pkg_decl_env.get(
+        return Entity.subunit_pkg_decl_env.get_first(
             '__nextpart', lookup=LK.flat, categories=noprims,
-        ).at(0).children_env
+        ).children_env
 
     @langkit_property()
     def subunit_pkg_decl_env():
@@ -9145,9 +9293,9 @@ class PackageBody(Body):
                 lambda pd=T.PackageDecl: pd.children_env,
                 lambda gpd=T.GenericPackageDecl: gpd.package_decl.children_env,
                 lambda _: PropertyError(LexicalEnv),
-            ).then(lambda public_part: public_part.get(
+            ).then(lambda public_part: public_part.get_first(
                 '__privatepart', LK.flat, categories=noprims
-            ).at(0).then(lambda pp: pp.children_env, default_val=public_part))
+            ).then(lambda pp: pp.children_env, default_val=public_part))
         )
 
 